@@ -1,10 +1,13 @@
 import os
 import json
-import subprocess
+import functools
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import sys, os
 
+# subprocess, tkinter.messagebox and PIL are imported at point of use:
+# they only matter on specific paths and cost startup time + RSS.
+
 def base_dir():
     # When built with PyInstaller, files live next to the EXE (onedir)
     if getattr(sys, "frozen", False):
@@ -13,18 +16,20 @@ def base_dir():
 
 BASE_DIR = base_dir()
 
-# Optional Pillow for banner image. App still runs without it.
-try:
-    from PIL import Image, ImageTk
-    PIL_OK = True
-except Exception:
-    PIL_OK = False
-
 APP_NAME = "Dehydrated Crosshair"
 OVERLAY_EXE_NAME = "CrosshairOverlay.exe"
 OVERLAY_JSON_NAME = "overlay_settings.json"
 APP_SETTINGS_NAME = "app_settings.json"
 BANNER_FILE = "Dehydrated_Crosshair_Banner.png"
+BANNER_CACHE_FILE = "banner_400x80.png"
+BANNER_SIZE = (400, 80)
+
+# Joined once; every path in the app is relative to BASE_DIR.
+OVERLAY_EXE_PATH = os.path.join(BASE_DIR, OVERLAY_EXE_NAME)
+OVERLAY_JSON_PATH = os.path.join(BASE_DIR, OVERLAY_JSON_NAME)
+APP_SETTINGS_PATH = os.path.join(BASE_DIR, APP_SETTINGS_NAME)
+BANNER_PATH = os.path.join(BASE_DIR, BANNER_FILE)
+BANNER_CACHE_PATH = os.path.join(BASE_DIR, BANNER_CACHE_FILE)
 
 STYLE_CHOICES_UI = ["Dot", "Plus", "Cross"]
 STYLE_MAP_TO_JSON = {"Dot": "dot", "Plus": "plus", "Cross": "cross"}
@@ -34,15 +39,32 @@ COLOR_CHOICES_UI = ["White", "Red", "Green", "Blue"]
 COLOR_MAP_TO_JSON = {"White": "white", "Red": "red", "Green": "green", "Blue": "blue"}
 COLOR_MAP_FROM_JSON = {v: k for k, v in COLOR_MAP_TO_JSON.items()}
 
-def app_dir() -> str:
-    return os.path.dirname(os.path.abspath(__file__))
+# Bound once; to_overlay_json runs on every overlay update.
+_STYLE_GET = STYLE_MAP_TO_JSON.get
+_COLOR_GET = COLOR_MAP_TO_JSON.get
 
-def atomic_write_json(path: str, data: dict):
+def atomic_write_bytes(path: str, buf: bytes):
+    # Pre-encoded bytes + raw os.write keeps the whole payload in one
+    # syscall instead of going through the buffered text-io layer.
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf)
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
+def atomic_write_json(path: str, data: dict):
+    atomic_write_bytes(path, json.dumps(data, indent=2).encode("utf-8"))
+
+def _raid_precompute(table: dict, costs: dict) -> dict:
+    # (structure, method) -> (pieces per unit, sulfur per piece, gp per piece)
+    return {
+        (s, m): (int(row.get(m, 0)), c["sulfur"], c["gp"])
+        for s, row in table.items()
+        for m, c in costs.items()
+    }
+
 class SettingsModel:
     def __init__(self):
         # crosshair
@@ -57,23 +79,39 @@ class SettingsModel:
         # app
         self.dark_mode = True
 
-    def to_overlay_json(self) -> dict:
+    def _snapshot(self) -> dict:
+        # Canonical casted view of the model; save and to_overlay_json both
+        # project from this so the casts live in one place.
         return {
             "enabled": bool(self.enabled),
-            "style": STYLE_MAP_TO_JSON.get(self.style_ui, "dot"),
+            "style_ui": self.style_ui,
             "size": int(self.size),
             "thickness": int(self.thickness),
             "outline": int(self.outline),
-            "color": COLOR_MAP_TO_JSON.get(self.color_ui, "white"),
-            "opacity": float(max(0.0, min(1.0, self.opacity))),
+            "color_ui": self.color_ui,
+            "opacity": float(self.opacity),
+            "dark_mode": bool(self.dark_mode),
+        }
+
+    def to_overlay_json(self) -> dict:
+        d = self._snapshot()
+        return {
+            "enabled": d["enabled"],
+            "style": _STYLE_GET(d["style_ui"], "dot"),
+            "size": d["size"],
+            "thickness": d["thickness"],
+            "outline": d["outline"],
+            "color": _COLOR_GET(d["color_ui"], "white"),
+            "opacity": max(0.0, min(1.0, d["opacity"])),
         }
 
     def load(self):
-        p = os.path.join(app_dir(), APP_SETTINGS_NAME)
-        if not os.path.exists(p):
-            return
+        # Single open in binary mode: no exists() pre-check (a missing file
+        # just means defaults) and json.loads on bytes skips the file-object
+        # read loop. The old json.load(open(...)) also leaked the handle.
         try:
-            data = json.load(open(p, "r", encoding="utf-8"))
+            with open(APP_SETTINGS_PATH, "rb") as f:
+                data = json.loads(f.read())
         except Exception:
             return
         self.enabled = bool(data.get("enabled", self.enabled))
@@ -86,62 +124,61 @@ class SettingsModel:
         self.dark_mode = bool(data.get("dark_mode", self.dark_mode))
 
     def save(self):
-        p = os.path.join(app_dir(), APP_SETTINGS_NAME)
-        data = {
-            "enabled": bool(self.enabled),
-            "style_ui": self.style_ui,
-            "size": int(self.size),
-            "thickness": int(self.thickness),
-            "outline": int(self.outline),
-            "color_ui": self.color_ui,
-            "opacity": float(self.opacity),
-            "dark_mode": bool(self.dark_mode),
-        }
-        atomic_write_json(p, data)
+        atomic_write_json(APP_SETTINGS_PATH, self._snapshot())
 
 class OverlayController:
     def __init__(self, model: SettingsModel):
         self.model = model
         self.proc = None
-
-    def overlay_exe_path(self) -> str:
-        return os.path.join(app_dir(), OVERLAY_EXE_NAME)
-
-    def overlay_json_path(self) -> str:
-        return os.path.join(app_dir(), OVERLAY_JSON_NAME)
-
-    def ensure_overlay_running(self):
-        exe = self.overlay_exe_path()
-        if not os.path.exists(exe):
+        self._proc_alive = False
+        self._last_json_bytes = None
+
+    def ensure_overlay_running(self, recheck=False):
+        # poll() costs a syscall per call (WaitForSingleObject on Windows),
+        # so hot paths trust the cached flag; discrete events pass
+        # recheck=True to notice a crashed overlay and restart it.
+        if self._proc_alive and self.proc is not None and not recheck:
+            return
+        import subprocess
+        if not os.path.exists(OVERLAY_EXE_PATH):
             raise FileNotFoundError(f"Missing {OVERLAY_EXE_NAME} next to the .py file.")
         if self.proc is not None and self.proc.poll() is None:
+            self._proc_alive = True
             return
+        self._proc_alive = False
         # Start overlay detached (no console). It will read overlay_settings.json from cwd.
         self.proc = subprocess.Popen(
-            [exe],
-            cwd=app_dir(),
+            [OVERLAY_EXE_PATH],
+            cwd=BASE_DIR,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0,
         )
+        self._proc_alive = True
 
     def write_overlay_settings(self):
-        atomic_write_json(self.overlay_json_path(), self.model.to_overlay_json())
+        # No indent: the overlay JSON is machine-read only.
+        payload = json.dumps(self.model.to_overlay_json()).encode("utf-8")
+        # Scales often fire several callbacks for the same quantized value;
+        # skip the write entirely when the payload hasn't changed.
+        if payload == self._last_json_bytes:
+            return
+        # Temp file + rename: the overlay's reader opens with FileShare.Read
+        # and must never see a torn write, so updates have to stay atomic.
+        atomic_write_bytes(OVERLAY_JSON_PATH, payload)
+        self._last_json_bytes = payload
 
     def set_enabled(self, enabled: bool):
         self.model.enabled = bool(enabled)
         if self.model.enabled:
-            self.ensure_overlay_running()
+            self.ensure_overlay_running(recheck=True)
         self.write_overlay_settings()
 
     def shutdown(self):
-        # Disable crosshair first so if overlay lingers, it's invisible.
-        try:
-            self.model.enabled = False
-            self.write_overlay_settings()
-        except Exception:
-            pass
+        # The disabled payload is written by App.on_close before this runs;
+        # here we just stop the process.
         try:
+            self._proc_alive = False
             if self.proc is not None and self.proc.poll() is None:
                 self.proc.terminate()
         except Exception:
@@ -158,6 +195,7 @@ class App:
         self.overlay = OverlayController(self.model)
 
         self.banner_photo = None
+        self._pending_write_id = None
 
         # Always ensure overlay_settings.json exists
         try:
@@ -188,6 +226,14 @@ class App:
             self.style.theme_use("clam")
         except Exception:
             pass
+        # Fonts, padding and the disabled-state map never change between
+        # themes; configure them once so a theme toggle only touches colors.
+        self.style.configure("Title.TLabel", font=("Segoe UI", 14, "bold"))
+        self.style.configure("Sub.TLabel", font=("Segoe UI", 9))
+        self.style.configure("TLabel", font=("Segoe UI", 10))
+        self.style.configure("TButton", padding=(12, 10), font=("Segoe UI", 10, "bold"))
+        self.style.map("TButton", foreground=[("disabled", "#777777")])
+        self.style.configure("TCombobox", padding=(8, 6))
 
     def _apply_theme(self):
         dark = bool(self.model.dark_mode)
@@ -203,17 +249,15 @@ class App:
 
         self.root.configure(bg=bg)
 
+        # Color-only updates; the static bits live in _build_styles.
         self.style.configure("TFrame", background=bg)
         self.style.configure("Panel.TFrame", background=panel)
-        self.style.configure("Title.TLabel", background=bg, foreground=fg, font=("Segoe UI", 14, "bold"))
-        self.style.configure("Sub.TLabel", background=bg, foreground=subfg, font=("Segoe UI", 9))
-        self.style.configure("TLabel", background=panel, foreground=fg, font=("Segoe UI", 10))
-        self.style.configure("TButton", background=btn, foreground=fg, padding=(12, 10), font=("Segoe UI", 10, "bold"))
+        self.style.configure("Title.TLabel", background=bg, foreground=fg)
+        self.style.configure("Sub.TLabel", background=bg, foreground=subfg)
+        self.style.configure("TLabel", background=panel, foreground=fg)
+        self.style.configure("TButton", background=btn, foreground=fg)
         self.style.map("TButton",
-                       background=[("active", btn_active), ("pressed", btn_active)],
-                       foreground=[("disabled", "#777777")])
-
-        self.style.configure("TCombobox", padding=(8, 6))
+                       background=[("active", btn_active), ("pressed", btn_active)])
         self.style.configure("Horizontal.TScale", background=panel)
 
         # update accent bar if present
@@ -230,21 +274,34 @@ class App:
         self.subtitle.configure(style="Sub.TLabel")
         self._refresh_toggle_text()
 
+    def _load_banner(self):
+        # The banner target size never changes, so resize once and cache the
+        # result next to the exe. After the first run tk.PhotoImage can load
+        # it directly and Pillow never gets imported.
+        if not os.path.exists(BANNER_CACHE_PATH):
+            if not os.path.exists(BANNER_PATH):
+                return None
+            try:
+                # Pillow is optional; skip the banner if it's missing.
+                from PIL import Image
+                img = Image.open(BANNER_PATH).resize(BANNER_SIZE, Image.Resampling.LANCZOS)
+                img.save(BANNER_CACHE_PATH, optimize=True)
+            except Exception:
+                return None
+        try:
+            return tk.PhotoImage(file=BANNER_CACHE_PATH)
+        except Exception:
+            return None
+
     def _build_ui(self):
         self.header = ttk.Frame(self.root)
         self.header.pack(fill="x", padx=14, pady=(14, 8))
 
         # Banner (optional). File: Dehydrated_Crosshair_Banner.png (400x80)
         banner_bg = "#151515" if bool(self.model.dark_mode) else "#f2f2f2"
-        banner_path = os.path.join(app_dir(), BANNER_FILE)
-        if PIL_OK and os.path.exists(banner_path):
-            try:
-                img = Image.open(banner_path)
-                img = img.resize((400, 80), Image.Resampling.LANCZOS)
-                self.banner_photo = ImageTk.PhotoImage(img)
-                tk.Label(self.header, image=self.banner_photo, bg=banner_bg).pack(anchor="w", pady=(0, 8))
-            except Exception:
-                self.banner_photo = None
+        self.banner_photo = self._load_banner()
+        if self.banner_photo is not None:
+            tk.Label(self.header, image=self.banner_photo, bg=banner_bg).pack(anchor="w", pady=(0, 8))
 
         self.title = ttk.Label(self.header, text="Version 1.0", style="Title.TLabel")
         self.title.pack(anchor="w")
@@ -281,6 +338,7 @@ class App:
 
     # ---------- Actions ----------
     def on_toggle(self):
+        from tkinter import messagebox
         try:
             self.overlay.set_enabled(not self.model.enabled)
             self._refresh_toggle_text()
@@ -288,6 +346,7 @@ class App:
             messagebox.showerror(APP_NAME, str(e))
 
     def on_save(self):
+        from tkinter import messagebox
         try:
             self.model.save()
             messagebox.showinfo(APP_NAME, "Saved.")
@@ -298,11 +357,39 @@ class App:
         self.model.dark_mode = not self.model.dark_mode
         self._apply_theme()
 
+    def _schedule_overlay_write(self):
+        # Coalesce bursts of slider callbacks into one trailing-edge write.
+        if self._pending_write_id is not None:
+            self.root.after_cancel(self._pending_write_id)
+        self._pending_write_id = self.root.after(30, self._flush_overlay)
+
+    def _flush_overlay(self):
+        if self._pending_write_id is not None:
+            self.root.after_cancel(self._pending_write_id)
+            self._pending_write_id = None
+        try:
+            # Liveness is verified once when the settings window opens;
+            # per-update writes just rewrite the file.
+            self.overlay.write_overlay_settings()
+        except Exception:
+            # Don't spam dialogs while dragging sliders
+            pass
+
     def on_close(self):
+        if self._pending_write_id is not None:
+            self._flush_overlay()
         try:
             self.model.save()
         except Exception:
             pass
+        # Disable the crosshair so if the overlay lingers past terminate,
+        # it's invisible. The byte-cache sees a changed payload here, so
+        # this single write always lands.
+        try:
+            self.model.enabled = False
+            self.overlay.write_overlay_settings()
+        except Exception:
+            pass
         try:
             self.overlay.shutdown()
         except Exception:
@@ -326,7 +413,22 @@ class App:
         "Explosive Ammo": {"sulfur": 25,   "gp": 10},
     }
 
-    def _fmt(self, n: int) -> str:
+    # Planner output per structure never changes; render each block once at
+    # class load so refresh is a single Text insert instead of a loop.
+    _RAID_PLANNER_TEXT = {
+        s: f"{s}\n" + "-" * 50 + "\n"
+           + "".join(f"{k:<16} : {row.get(k, '-')}\n"
+                     for k in ("Rockets", "C4", "Satchels", "Explosive Ammo"))
+        for s, row in _RAID_TABLE.items()
+    }
+
+    # Tabulated once so calculator refresh is three multiplies instead of
+    # chained dict lookups on every keystroke.
+    _PRECOMP = _raid_precompute(_RAID_TABLE, _COSTS)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _fmt(n) -> str:
         try:
             return f"{int(n):,}"
         except Exception:
@@ -351,20 +453,13 @@ class App:
         ttk.Combobox(row, textvariable=structure_var, values=list(self._RAID_TABLE.keys()),
                     state="readonly", width=26).pack(side="right")
 
-        out = tk.Text(outer, width=56, height=10, state="disabled",
-                      font=("Consolas", 10), borderwidth=0, highlightthickness=1)
+        # Read-only output: a Label is far lighter than a Text widget (no
+        # tag table/undo stack) and updates in one configure call.
+        out = ttk.Label(outer, font=("Consolas", 10), justify="left", anchor="w", width=56)
         out.pack(fill="both", expand=False)
 
         def refresh(*_):
-            struct = structure_var.get()
-            data = self._RAID_TABLE.get(struct, {})
-            out.config(state="normal")
-            out.delete("1.0", "end")
-            out.insert("end", f"{struct}\n")
-            out.insert("end", "-" * 50 + "\n")
-            for k in ["Rockets", "C4", "Satchels", "Explosive Ammo"]:
-                out.insert("end", f"{k:<16} : {data.get(k, '-')}\n")
-            out.config(state="disabled")
+            out.configure(text=self._RAID_PLANNER_TEXT.get(structure_var.get(), ""))
 
         structure_var.trace_add("write", refresh)
         refresh()
@@ -400,8 +495,7 @@ class App:
         ttk.Spinbox(grid, from_=1, to=999, textvariable=count_var, width=8)\
             .grid(row=1, column=1, sticky="w", padx=(8, 0), pady=(10, 0))
 
-        out = tk.Text(outer, width=56, height=12, state="disabled",
-                      font=("Consolas", 10), borderwidth=0, highlightthickness=1)
+        out = ttk.Label(outer, font=("Consolas", 10), justify="left", anchor="w", width=56)
         out.pack(fill="both", expand=False)
 
         def refresh(*_):
@@ -409,40 +503,69 @@ class App:
             method = method_var.get()
             cnt = max(1, int(count_var.get()))
 
-            per_piece = int(self._RAID_TABLE.get(struct, {}).get(method, 0))
+            per_piece, sulfur_per, gp_per = self._PRECOMP.get((struct, method), (0, 0, 0))
             total_needed = per_piece * cnt
-
-            cost = self._COSTS.get(method, {"sulfur": 0, "gp": 0})
-            sulfur_direct = int(cost["sulfur"] * total_needed)
-            gp = int(cost["gp"] * total_needed)
+            sulfur_direct = sulfur_per * total_needed
+            gp = gp_per * total_needed
 
             sulfur_for_gp = gp * 2
             charcoal = gp
             sulfur_total = sulfur_direct + sulfur_for_gp
 
-            out.config(state="normal")
-            out.delete("1.0", "end")
-            out.insert("end", f"Target: {struct} x{cnt}\n")
-            out.insert("end", f"Method: {method}\n")
-            out.insert("end", f"Total Needed: {total_needed}\n")
-            out.insert("end", "-" * 50 + "\n")
-            out.insert("end", "Est. Materials:\n")
-            out.insert("end", f"  Sulfur (direct): {self._fmt(sulfur_direct)}\n")
-            out.insert("end", f"  Gunpowder:       {self._fmt(gp)}\n")
-            out.insert("end", f"  Charcoal:        {self._fmt(charcoal)}\n")
-            out.insert("end", f"  Sulfur (for GP): {self._fmt(sulfur_for_gp)}\n")
-            out.insert("end", f"  Sulfur total:    {self._fmt(sulfur_total)}\n")
-            out.config(state="disabled")
-
-        structure_var.trace_add("write", refresh)
-        method_var.trace_add("write", refresh)
-        count_var.trace_add("write", refresh)
+            body = (
+                f"Target: {struct} x{cnt}\n"
+                f"Method: {method}\n"
+                f"Total Needed: {total_needed}\n"
+                + "-" * 50 + "\n"
+                "Est. Materials:\n"
+                f"  Sulfur (direct): {self._fmt(sulfur_direct)}\n"
+                f"  Gunpowder:       {self._fmt(gp)}\n"
+                f"  Charcoal:        {self._fmt(charcoal)}\n"
+                f"  Sulfur (for GP): {self._fmt(sulfur_for_gp)}\n"
+                f"  Sulfur total:    {self._fmt(sulfur_total)}"
+            )
+            out.configure(text=body)
+
+        # Trailing-edge debounce: typing "999" fires the count trace three
+        # times, but only one refresh runs.
+        pending = [None]
+
+        def do_refresh():
+            pending[0] = None
+            refresh()
+
+        def schedule_refresh(*_):
+            if pending[0] is not None:
+                win.after_cancel(pending[0])
+            pending[0] = win.after(40, do_refresh)
+
+        structure_var.trace_add("write", schedule_refresh)
+        method_var.trace_add("write", schedule_refresh)
+        count_var.trace_add("write", schedule_refresh)
+
+        def cancel_pending(event):
+            # <Destroy> also fires here for each child via bindtags; only
+            # act for the window itself so a refresh scheduled just before
+            # close can't run against destroyed widgets.
+            if event.widget is win and pending[0] is not None:
+                win.after_cancel(pending[0])
+                pending[0] = None
+
+        win.bind("<Destroy>", cancel_pending)
         refresh()
 
         ttk.Button(outer, text="Close", command=win.destroy).pack(anchor="e", pady=(10, 0))
 
     # ---------- Settings window ----------
     def open_settings(self):
+        # The exe path can't change mid-session; check the overlay once per
+        # settings window instead of on every slider callback.
+        if self.model.enabled:
+            try:
+                self.overlay.ensure_overlay_running(recheck=True)
+            except Exception:
+                pass
+
         win = tk.Toplevel(self.root)
         win.title("Settings")
         win.resizable(False, False)
@@ -454,30 +577,17 @@ class App:
         panel = ttk.Frame(outer, style="Panel.TFrame")
         panel.pack(fill="both", expand=True)
 
-        # Variables
+        # Variables (comboboxes only; Scales feed the model straight from
+        # their command value, skipping the Var round-trip that fired each
+        # update twice via the write trace).
         style_var = tk.StringVar(value=self.model.style_ui)
         color_var = tk.StringVar(value=self.model.color_ui)
-        size_var = tk.IntVar(value=int(self.model.size))
-        outline_var = tk.IntVar(value=int(self.model.outline))
-        opacity_var = tk.DoubleVar(value=float(self.model.opacity))
 
-        def push_to_overlay():
-            # Update model from vars
+        def push_combo(*_):
+            # Discrete events: update model and flush straight to disk.
             self.model.style_ui = style_var.get()
             self.model.color_ui = color_var.get()
-            self.model.size = int(size_var.get())
-            self.model.outline = int(outline_var.get())
-            self.model.opacity = float(opacity_var.get())
-
-            # Live update: write JSON every move (atomic replace)
-            try:
-                # keep enabled state as-is; if enabled, ensure overlay running
-                if self.model.enabled:
-                    self.overlay.ensure_overlay_running()
-                self.overlay.write_overlay_settings()
-            except Exception:
-                # Don't spam dialogs while dragging sliders
-                pass
+            self._flush_overlay()
 
         # Layout helpers
         def row(label: str):
@@ -490,13 +600,14 @@ class App:
         fr = row("Style")
         cb = ttk.Combobox(fr, textvariable=style_var, values=STYLE_CHOICES_UI, state="readonly")
         cb.pack(fill="x", pady=(6, 0))
-        style_var.trace_add("write", lambda *_: push_to_overlay())
+        style_var.trace_add("write", push_combo)
 
         # Size
         fr = row("Size")
         sc = ttk.Scale(fr, from_=2, to=40, orient="horizontal",
-                       command=lambda v: (size_var.set(int(float(v))), push_to_overlay()))
-        sc.set(size_var.get())
+                       command=lambda v: (setattr(self.model, "size", int(float(v))),
+                                          self._schedule_overlay_write()))
+        sc.set(self.model.size)
         sc.pack(fill="x", pady=(6, 0))
         # Thickness control removed (core overlay stable)
 
@@ -504,27 +615,36 @@ class App:
         fr = row("Color")
         cb2 = ttk.Combobox(fr, textvariable=color_var, values=COLOR_CHOICES_UI, state="readonly")
         cb2.pack(fill="x", pady=(6, 0))
-        color_var.trace_add("write", lambda *_: push_to_overlay())
+        color_var.trace_add("write", push_combo)
 
         # Opacity
         fr = row("Opacity")
         sc3 = ttk.Scale(fr, from_=0.05, to=1.0, orient="horizontal",
-                        command=lambda v: (opacity_var.set(float(v)), push_to_overlay()))
-        sc3.set(opacity_var.get())
+                        command=lambda v: (setattr(self.model, "opacity", float(v)),
+                                           self._schedule_overlay_write()))
+        sc3.set(self.model.opacity)
         sc3.pack(fill="x", pady=(6, 0))
 
         # Outline
         fr = row("Outline / Border")
         sc4 = ttk.Scale(fr, from_=0, to=8, orient="horizontal",
-                        command=lambda v: (outline_var.set(int(float(v))), push_to_overlay()))
-        sc4.set(outline_var.get())
+                        command=lambda v: (setattr(self.model, "outline", int(float(v))),
+                                           self._schedule_overlay_write()))
+        sc4.set(self.model.outline)
         sc4.pack(fill="x", pady=(6, 0))
 
+        def close_settings():
+            # Flush any pending debounced write so the final state isn't lost.
+            if self._pending_write_id is not None:
+                self._flush_overlay()
+            win.destroy()
+
         # Footer buttons
         footer = ttk.Frame(panel, style="Panel.TFrame")
         footer.pack(fill="x", padx=14, pady=14)
 
-        ttk.Button(footer, text="Close", command=win.destroy).pack(side="right")
+        ttk.Button(footer, text="Close", command=close_settings).pack(side="right")
+        win.protocol("WM_DELETE_WINDOW", close_settings)
 
         # Apply theme to child widgets
         # (ttk uses style; background already set)